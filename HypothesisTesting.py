@@ -1,11 +1,107 @@
+from enum import IntEnum
 from math import sqrt
-from scipy import stats
+import numpy as np
+from scipy.special import ndtr, ndtri
 import Statistics
 
 
+class Direction(IntEnum):
+    TWO_TAILED = 0
+    LEFT_TAILED = 1
+    RIGHT_TAILED = 2
+
+
+_DIRECTIONS = {direction.name.lower().replace('_', '-'): direction for direction in Direction}
+
+# Relation signs of the null and the alternative hypothesis.
+_DIRECTION_SIGNS = {Direction.TWO_TAILED: ['=', '≠'],
+                    Direction.LEFT_TAILED: ['≥', '<'],
+                    Direction.RIGHT_TAILED: ['≤', '>']}
+
+# Functions computing the critical value from the significance level and the p-value from the z-value(s).
+_DISPATCH = {Direction.TWO_TAILED: (lambda significance_level: ndtri(1 - significance_level / 2),
+                                    lambda test_statistic: 2 * ndtr(-np.abs(test_statistic))),
+             Direction.LEFT_TAILED: (lambda significance_level: ndtri(significance_level),
+                                     lambda test_statistic: ndtr(test_statistic)),
+             Direction.RIGHT_TAILED: (lambda significance_level: ndtri(1 - significance_level),
+                                      lambda test_statistic: ndtr(-test_statistic))}
+
+
+def _parse_direction(direction_of_hypothesis: [str, Direction]) -> Direction:
+    """
+    Looks up the direction of the alternative hypothesis by its name, or passes a Direction through.
+
+    :returns: The Direction matching the given name.
+    """
+
+    if isinstance(direction_of_hypothesis, Direction):
+        return direction_of_hypothesis
+
+    try:
+        return _DIRECTIONS[direction_of_hypothesis]
+    except (KeyError, TypeError):
+        raise ValueError('Invalid alternative hypothesis direction. Please, choose "two-tailed", "left-tailed" or '
+                         '"right-tailed".') from None
+
+
+def _report_one_sample_z(hypothetical_population_mean, direction, test_statistic, p_value, critical_value,
+                         significance_level, null_hypothesis_rejected):
+    """
+    Prints the hypotheses, the test statistic, the p-value, the critical value and the conclusion of a one-sample
+    z-test.
+
+    :returns: None.
+    """
+
+    direction_sign = _DIRECTION_SIGNS[direction]
+
+    print('-----------------\n'
+          'Hypothesis:\n'
+          f'H₀: µ {direction_sign[0]} {hypothetical_population_mean}\n'
+          f'H₁: µ {direction_sign[1]} {hypothetical_population_mean}\n'
+          '-----------------\n'
+          'Test type:\n'
+          f'{direction.name.capitalize().replace("_", "-")} One-sample Z-test\n'
+          '-----------------\n'
+          'Test statistic (Z-value):\n'
+          f'{test_statistic}\n'
+          '-----------------\n'
+          'P-value:\n'
+          f'{p_value}\n'
+          '-----------------\n'
+          'Critical value:\n'
+          f'{critical_value}\n'
+          '-----------------\n'
+          'Conclusion:')
+
+    rounded_p_value = round(p_value, 4)
+
+    reject_or_fail_to_reject = 'reject' if null_hypothesis_rejected else 'fail to reject'
+    if direction == Direction.TWO_TAILED:
+        print(f'Since the calculated z-value ({round(test_statistic, 4)}) falls '
+              f'{"outside" if null_hypothesis_rejected else "within"} '
+              f'the critical region (from {-critical_value} to {critical_value}) and the p-value '
+              f'({rounded_p_value}) is {"less" if null_hypothesis_rejected else "grater"} than the '
+              f'significance level ({significance_level}), we {reject_or_fail_to_reject} the null hypothesis.')
+    elif direction == Direction.RIGHT_TAILED:
+        print(rounded_p_value)
+        print(f'Since the calculated z-value ({round(test_statistic, 4)}) is '
+              f'{"grater" if null_hypothesis_rejected else "less"} than the critical value '
+              f'({critical_value}) and the p-value ({rounded_p_value}) is '
+              f'{"less" if null_hypothesis_rejected else "grater"} than the significance level '
+              f'({significance_level}), we {reject_or_fail_to_reject} the null hypothesis.')
+    else:
+        print(f'Since the calculated z-value ({round(test_statistic, 4)}) is '
+              f'{"less" if null_hypothesis_rejected else "grater"} than the critical value '
+              f'({critical_value}) and the p-value ({rounded_p_value}) is '
+              f'{"less" if null_hypothesis_rejected else "grater"} than the significance level '
+              f'({significance_level}), we {reject_or_fail_to_reject} the null hypothesis.')
+    print('-----------------')
+
+
 class DataSetHypothesisTester(Statistics.DataSetWithStatistics):
-    def __init__(self, data_set=None):
-        super().__init__(data_set)
+    def __init__(self, data_set=None, dtype=np.float64):
+        super().__init__(data_set, dtype=dtype)
 
     def one_sample_z_test(self, hypothetical_population_mean: [int, float], population_standard_deviation=None,
                           significance_level=0.05, direction_of_hypothesis='two-tailed', log=False):
@@ -15,9 +111,8 @@ class DataSetHypothesisTester(Statistics.DataSetWithStatistics):
         :returns: A list containing the z-value, p-value, and a boolean indicating whether to reject the null hypothesis.
         """
 
-        if direction_of_hypothesis not in ['right-tailed', 'left-tailed', 'two-tailed']:
-            raise ValueError('Invalid alternative hypothesis direction. Please, choose "two-tailed", "left-tailed" or '
-                             '"right-tailed".')
+        direction = _parse_direction(direction_of_hypothesis)
+        critical_value_function, p_value_function = _DISPATCH[direction]
 
         sample_mean = self.arithmetic_mean()
 
@@ -27,15 +122,8 @@ class DataSetHypothesisTester(Statistics.DataSetWithStatistics):
         test_statistic = (sample_mean - hypothetical_population_mean) / (
                     population_standard_deviation / sqrt(self.size))
 
-        if direction_of_hypothesis == 'two-tailed':
-            critical_value = round(stats.norm.ppf(1 - significance_level / 2), 3)
-            p_value = 2 * (1 - stats.norm.cdf(abs(test_statistic)))
-        elif direction_of_hypothesis == 'right-tailed':
-            critical_value = round(stats.norm.ppf(1 - significance_level), 3)
-            p_value = 1 - stats.norm.cdf(test_statistic)
-        else:
-            critical_value = round(stats.norm.ppf(significance_level), 3)
-            p_value = stats.norm.cdf(test_statistic)
+        critical_value = round(critical_value_function(significance_level), 3)
+        p_value = p_value_function(test_statistic)
 
         null_hypothesis_rejected = p_value < significance_level
 
@@ -44,49 +132,37 @@ class DataSetHypothesisTester(Statistics.DataSetWithStatistics):
                   ('null hypothesis rejected', null_hypothesis_rejected)]
 
         if log:
-            direction_sign = {'left-tailed': ['≥', '<'],
-                              'right-tailed': ['≤', '>'],
-                              'two-tailed': ['=', '≠']}.get(direction_of_hypothesis)
-
-            print('-----------------\n'
-                  'Hypothesis:\n'
-                  f'H₀: µ {direction_sign[0]} {hypothetical_population_mean}\n'
-                  f'H₁: µ {direction_sign[1]} {hypothetical_population_mean}\n'
-                  '-----------------\n'
-                  'Test type:\n'
-                  f'{direction_of_hypothesis.capitalize()} One-sample Z-test\n'
-                  '-----------------\n'
-                  'Test statistic (Z-value):\n'
-                  f'{test_statistic}\n'
-                  '-----------------\n'
-                  'P-value:\n'
-                  f'{p_value}\n'
-                  '-----------------\n'
-                  'Critical value:\n'
-                  f'{critical_value}\n'
-                  '-----------------\n'
-                  'Conclusion:')
-
-            reject_or_fail_to_reject = 'reject' if null_hypothesis_rejected else 'fail to reject'
-            if direction_of_hypothesis == 'two-tailed':
-                print(f'Since the calculated z-value ({round(test_statistic, 4)}) falls '
-                      f'{"outside" if null_hypothesis_rejected else "within"} '
-                      f'the critical region (from {-critical_value} to {critical_value}) and the p-value '
-                      f'({round(p_value, 4)}) is {"less" if null_hypothesis_rejected else "grater"} than the '
-                      f'significance level ({significance_level}), we {reject_or_fail_to_reject} the null hypothesis.')
-            elif direction_of_hypothesis == 'right-tailed':
-                print(round(p_value, 4))
-                print(f'Since the calculated z-value ({round(test_statistic, 4)}) is '
-                      f'{"grater" if null_hypothesis_rejected else "less"} than the critical value '
-                      f'({critical_value}) and the p-value ({round(p_value, 4)}) is '
-                      f'{"less" if null_hypothesis_rejected else "grater"} than the significance level '
-                      f'({significance_level}), we {reject_or_fail_to_reject} the null hypothesis.')
-            else:
-                print(f'Since the calculated z-value ({round(test_statistic, 4)}) is '
-                      f'{"less" if null_hypothesis_rejected else "grater"} than the critical value '
-                      f'({critical_value}) and the p-value ({round(p_value, 4)}) is '
-                      f'{"less" if null_hypothesis_rejected else "grater"} than the significance level '
-                      f'({significance_level}), we {reject_or_fail_to_reject} the null hypothesis.')
-            print('-----------------')
+            _report_one_sample_z(hypothetical_population_mean, direction, test_statistic, p_value, critical_value,
+                                 significance_level, null_hypothesis_rejected)
+
+        return result
+
+    def one_sample_z_test_batch(self, hypothetical_population_means, population_standard_deviation=None,
+                                significance_level=0.05, direction_of_hypothesis='two-tailed'):
+        """
+        Performs a one-sample z-test on the sample data for each of the given hypothetical population means at once.
+
+        :returns: A structured NumPy array with the fields 'z-value', 'p-value' and 'null hypothesis rejected', holding
+        one record per hypothetical population mean.
+        """
+
+        p_value_function = _DISPATCH[_parse_direction(direction_of_hypothesis)][1]
+
+        hypothetical_population_means = np.asarray(hypothetical_population_means, dtype=np.float64)
+
+        if not population_standard_deviation:
+            population_standard_deviation = self.standard_deviation()
+
+        standard_error = population_standard_deviation / sqrt(self.size)
+        test_statistics = (self.arithmetic_mean() - hypothetical_population_means) / standard_error
+
+        p_values = p_value_function(test_statistics)
+
+        result = np.empty(test_statistics.shape, dtype=[('z-value', np.float64),
+                                                        ('p-value', np.float64),
+                                                        ('null hypothesis rejected', np.bool_)])
+        result['z-value'] = test_statistics
+        result['p-value'] = p_values
+        result['null hypothesis rejected'] = p_values < significance_level
 
         return result
@@ -1,14 +1,100 @@
 from math import sqrt
 
+import numpy as np
+from numba import njit, types
 
-class DataSet(list):
-    def __init__(self, data: list):
+# Datasets keep their values in read-only arrays, which the kernels have to accept explicitly.
+_FLOAT_ARRAYS = (types.Array(types.float64, 1, 'A', readonly=True),
+                 types.Array(types.float32, 1, 'A', readonly=True))
+
+
+@njit(types.UniTuple(types.float64, 2)(types.Array(types.float64, 1, 'C', readonly=True)), cache=True, fastmath=True)
+def _mean_var(arr):
+    """
+    Compute the mean and the biased variance of a float64 array in two passes without allocating the differences.
+
+    :returns: A tuple of the mean and the biased variance.
+    """
+
+    sum_of_values = 0.0
+    for i in range(arr.size):
+        sum_of_values += arr[i]
+    mean = sum_of_values / arr.size
+
+    sum_of_squared_diffs = 0.0
+    for i in range(arr.size):
+        diff = arr[i] - mean
+        sum_of_squared_diffs += diff * diff
+
+    return mean, sum_of_squared_diffs / arr.size
+
+
+@njit([types.Tuple((types.float64[:], types.int64))(array) for array in _FLOAT_ARRAYS], cache=True)
+def _mode_sorted(sorted_arr):
+    """
+    Scan the runs of equal values of a sorted array for the most frequent ones.
+
+    :returns: A tuple of an array of the most frequent values (in ascending order) and their frequency.
+    """
+
+    modes = np.empty(sorted_arr.size, dtype=np.float64)
+    num_of_modes = 0
+    max_freq = 0
+    run_length = 0
+
+    for i in range(sorted_arr.size):
+        if i > 0 and sorted_arr[i] == sorted_arr[i - 1]:
+            run_length += 1
+        else:
+            run_length = 1
+
+        if run_length > max_freq:
+            modes[0] = sorted_arr[i]
+            num_of_modes = 1
+            max_freq = run_length
+        elif run_length == max_freq:
+            modes[num_of_modes] = sorted_arr[i]
+            num_of_modes += 1
+
+    return modes[:num_of_modes], max_freq
+
+
+class DataSet:
+    def __init__(self, data: [list, np.ndarray, 'DataSet'], dtype=np.float64):
         """
-        Construct a DataSet object from a list of data.
+        Construct a DataSet object from a list, a NumPy array or another DataSet. The values are stored in a read-only
+        contiguous array of the given floating point type (float64 by default, float32 halves the memory traffic of
+        large datasets). If the given data already is such an array, it is shared without copying, so it must not be
+        modified afterwards.
         """
 
-        super().__init__(data)
-        self.size = len(data)
+        if isinstance(data, DataSet):
+            data = data._arr
+
+        if np.dtype(dtype) not in (np.float32, np.float64):
+            raise ValueError('Invalid dtype. Please, choose np.float64 or np.float32.')
+
+        # np.asarray keeps None and scalars 0-d (np.ascontiguousarray would promote them to 1-d), so a single
+        # conversion is enough to validate the shape.
+        arr = np.asarray(data, dtype=dtype)
+        if arr.ndim != 1:
+            raise ValueError('A DataSet must be constructed from a one-dimensional sequence of values')
+
+        self._arr = np.ascontiguousarray(arr).view()
+        self._arr.flags.writeable = False
+        self.size = self._arr.size
+
+    def __len__(self) -> int:
+        return self._arr.size
+
+    def __iter__(self):
+        return iter(self._arr)
+
+    def __getitem__(self, item):
+        return self._arr[item]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._arr.tolist()})'
 
     def __pow__(self, power: int):
         """
@@ -17,7 +103,9 @@ class DataSet(list):
         :returns: A new DataSet object with each element raised to the specified power.
         """
 
-        return DataSet([value ** power for value in self])
+        powers = np.power(self._arr, power)
+
+        return DataSet(powers, dtype=powers.dtype)
 
     def __mul__(self, other: 'DataSet'):
         """
@@ -26,15 +114,20 @@ class DataSet(list):
          :returns: A new DataSet object with the element-wise product of the two datasets.
         """
 
-        return DataSet([first_set_value * second_set_value for first_set_value, second_set_value in zip(self, other)])
+        products = np.multiply(self._arr, other._arr)
+
+        return DataSet(products, dtype=products.dtype)
 
 
 class DataSetWithStatistics(DataSet):
-    def __init__(self, data_set: list):
-        super().__init__(data=data_set)
+    def __init__(self, data_set: list, dtype=np.float64):
+        super().__init__(data=data_set, dtype=dtype)
 
         self.__sum_of_observations = None
         self.__is_num_of_items_even = None
+        self.__arithmetic_mean = None
+        self.__standard_deviation = {}
+        self.__sorted_values = None
 
     def sum_of_observations(self) -> [int, float]:
         """
@@ -44,7 +137,7 @@ class DataSetWithStatistics(DataSet):
         """
 
         if self.__sum_of_observations is None:
-            self.__sum_of_observations = sum(self)
+            self.__sum_of_observations = float(self._arr.sum(dtype=np.float64))
 
         return self.__sum_of_observations
 
@@ -67,27 +160,35 @@ class DataSetWithStatistics(DataSet):
         :returns: The arithmetic mean of the dataset.
         """
 
-        sum_of_observations = self.sum_of_observations
-
         if bessel_correction:
-            return sum_of_observations() / (self.size - 1)
-        else:
-            return sum_of_observations() / self.size
+            return self.sum_of_observations() / (self.size - 1)
 
-    def median(self) -> [int, float]:
+        if self.__arithmetic_mean is None:
+            self.__arithmetic_mean = self.sum_of_observations() / self.size
+
+        return self.__arithmetic_mean
+
+    def sorted_values(self) -> np.ndarray:
         """
-        Compute the arithmetic mean of a sorted dataset.
+        Sorts the values of the dataset in ascending order.
 
-        :returns: The median of the dataset.
+        :returns: A read-only NumPy array of the sorted values of the dataset.
         """
 
-        if self.is_num_of_items_even() is False:
-            return self[self.size // 2]
+        if self.__sorted_values is None:
+            self.__sorted_values = np.sort(self._arr)
+            self.__sorted_values.flags.writeable = False
 
-        idx_of_second_mid_value = self.size // 2
-        idx_of_first_mid_value = idx_of_second_mid_value - 1
+        return self.__sorted_values
 
-        return (self[idx_of_first_mid_value] + self[idx_of_second_mid_value]) / 2
+    def median(self) -> [int, float]:
+        """
+        Compute the median of the dataset.
+
+        :returns: The median of the dataset.
+        """
+
+        return float(np.median(self._arr))
 
     def mode(self) -> [int, float]:
         """
@@ -96,18 +197,8 @@ class DataSetWithStatistics(DataSet):
         :returns: The mode of the dataset.
         """
 
-        freq_dictionary = {}
-        for value in self:
-            freq_dictionary[value] = freq_dictionary.get(value, 0) + 1
-
-        modes_list = []
-        max_freq = 0
-        for value, value_freq in freq_dictionary.items():
-            if value_freq > max_freq:
-                modes_list = [value]
-                max_freq = value_freq
-            elif value_freq == max_freq:
-                modes_list.append(value)
+        modes, max_freq = _mode_sorted(self.sorted_values())
+        modes_list = modes.tolist()
 
         num_of_modes = len(modes_list)
         if max_freq > 1 and num_of_modes > 1:
@@ -117,6 +208,15 @@ class DataSetWithStatistics(DataSet):
         else:
             raise ValueError('No mode found')
 
+    def min_max(self) -> tuple:
+        """
+        Find the smallest and the largest value of the dataset.
+
+        :returns: A tuple of the smallest and the largest value of the dataset.
+        """
+
+        return float(self._arr.min()), float(self._arr.max())
+
     def range(self) -> [int, float]:
         """
         Compute the range of the dataset.
@@ -124,7 +224,7 @@ class DataSetWithStatistics(DataSet):
         :returns: The range of the dataset.
         """
 
-        return max(self) - min(self)
+        return float(np.ptp(self._arr))
 
     def diff_between_values_and_mean(self, squared=True) -> 'DataSetWithStatistics':
         """
@@ -135,10 +235,11 @@ class DataSetWithStatistics(DataSet):
         dataset and the arithmetic mean.
         """
 
-        data_set_mean = self.arithmetic_mean()
-        diff = DataSetWithStatistics([value - data_set_mean for value in self])
+        diff = np.subtract(self._arr, self.arithmetic_mean())
+        if squared:
+            np.square(diff, out=diff)
 
-        return DataSetWithStatistics(diff ** 2 if squared else diff)
+        return DataSetWithStatistics(diff, dtype=diff.dtype)
 
     def variance(self, bessel_correction=True):
         """
@@ -148,9 +249,16 @@ class DataSetWithStatistics(DataSet):
         :returns: The computed variance as a float.
         """
 
-        squared_differences = self.diff_between_values_and_mean()
+        ddof = 1 if bessel_correction else 0
+        if self.size <= ddof:
+            raise ZeroDivisionError(f'Cannot compute the variance of {self.size} value(s) with {ddof} delta degrees of '
+                                    f'freedom')
+
+        if self._arr.dtype == np.float64:
+            _, variance = _mean_var(self._arr)
+            return variance * self.size / (self.size - 1) if bessel_correction else variance
 
-        return squared_differences.arithmetic_mean(bessel_correction)
+        return float(np.var(self._arr, dtype=np.float64, ddof=ddof))
 
     def standard_deviation(self, bessel_correction=True):
         """
@@ -160,7 +268,10 @@ class DataSetWithStatistics(DataSet):
         :returns: The computed standard deviation as a float.
         """
 
-        return sqrt(self.variance(bessel_correction))
+        if bessel_correction not in self.__standard_deviation:
+            self.__standard_deviation[bessel_correction] = sqrt(self.variance(bessel_correction))
+
+        return self.__standard_deviation[bessel_correction]
 
     def covariance(self, other, bessel_correction=True, raw_covariance=False):
         """
@@ -172,12 +283,14 @@ class DataSetWithStatistics(DataSet):
         the 'raw_covariance' parameter is True.
         """
 
-        set_1_diff = self.diff_between_values_and_mean(squared=False)
-        set_2_diff = other.diff_between_values_and_mean(squared=False)
-        products_of_sets = set_1_diff * set_2_diff
+        set_1_diff = self._arr - self.arithmetic_mean()
+        set_2_diff = other._arr - other.arithmetic_mean()
+        raw_covariance_value = float(np.dot(set_1_diff, set_2_diff))
+
+        if raw_covariance:
+            return raw_covariance_value
 
-        return sum(products_of_sets) if raw_covariance \
-            else DataSetWithStatistics(products_of_sets).arithmetic_mean(bessel_correction)
+        return raw_covariance_value / (self.size - 1 if bessel_correction else self.size)
 
     def pearson_correlation_coefficient(self, other):
         """
@@ -186,10 +299,10 @@ class DataSetWithStatistics(DataSet):
         :returns: The computed Pearson correlation coefficient between two datasets as a float.
         """
 
-        raw_covariance = self.covariance(other, raw_covariance=True)
-        set_1_sum_of_squared_diffs = sum(self.diff_between_values_and_mean(squared=True))
-        set_2_sum_of_squared_diffs = sum(other.diff_between_values_and_mean(squared=True))
-        product_of_roots = sqrt(set_1_sum_of_squared_diffs) * sqrt(set_2_sum_of_squared_diffs)
+        set_1_diff = self._arr - self.arithmetic_mean()
+        set_2_diff = other._arr - other.arithmetic_mean()
+        raw_covariance = float(np.dot(set_1_diff, set_2_diff))
+        product_of_roots = sqrt(float(np.dot(set_1_diff, set_1_diff)) * float(np.dot(set_2_diff, set_2_diff)))
 
         return raw_covariance / product_of_roots
 
@@ -200,15 +313,7 @@ class DataSetWithStatistics(DataSet):
         :returns: A list of the first, second (median), and third quartiles of the dataset.
         """
 
-        sorted_data_set = DataSetWithStatistics(sorted(self))
-
-        idx_of_mid_value = sorted_data_set.size // 2
-        first_quartile = DataSetWithStatistics(sorted_data_set[:idx_of_mid_value]).median()
-
-        idx_of_mid_value_for_third_quartile = idx_of_mid_value if self.is_num_of_items_even() else idx_of_mid_value + 1
-        third_quartile = DataSetWithStatistics(sorted_data_set[idx_of_mid_value_for_third_quartile:]).median()
-
-        return [first_quartile, self.median(), third_quartile]
+        return np.quantile(self._arr, [0.25, 0.5, 0.75], method='linear').tolist()
 
     def interquartile_range(self):
         """
@@ -234,8 +339,17 @@ class DataSetWithStatistics(DataSet):
         lower_limit = first_quantile - outlier_step * interquartile_range
         upper_limit = third_quantile + outlier_step * interquartile_range
 
-        for value in reversed(self):
-            if value < lower_limit or value > upper_limit:
-                self.remove(value)
-                if log:
-                    print(f'The outlier {value} has been removed')
+        mask = (self._arr >= lower_limit) & (self._arr <= upper_limit)
+        kept_values = self._arr[mask]
+        kept_values.flags.writeable = False
+
+        if log and kept_values.size < self.size:
+            print('\n'.join(f'The outlier {value} has been removed' for value in self._arr[~mask].tolist()))
+
+        self._arr = kept_values
+        self.size = kept_values.size
+        self.__sum_of_observations = None
+        self.__is_num_of_items_even = None
+        self.__arithmetic_mean = None
+        self.__standard_deviation = {}
+        self.__sorted_values = None